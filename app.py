@@ -1,5 +1,5 @@
 import streamlit as st
-from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_system import Owner, Pet, Task, Scheduler, SPECIES, TASK_TYPES, PRIORITIES
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="centered")
 
@@ -46,22 +46,24 @@ if "owner" not in st.session_state:
 
 # Owner Information Section
 st.subheader("👤 Owner Information")
-col1, col2 = st.columns(2)
-with col1:
-    owner_name = st.text_input("Owner name", value=st.session_state.owner.name, key="owner_name_input")
-    if owner_name != st.session_state.owner.name:
+# Batch owner edits in a form so typing doesn't rerun the whole page
+with st.form("owner_info"):
+    col1, col2 = st.columns(2)
+    with col1:
+        owner_name = st.text_input("Owner name", value=st.session_state.owner.name, key="owner_name_input")
+    with col2:
+        available_hours = st.slider(
+            "Available hours",
+            min_value=0,
+            max_value=23,
+            value=(st.session_state.owner.available_start_hour, st.session_state.owner.available_end_hour),
+            format="%d:00"
+        )
+    
+    if st.form_submit_button("Update"):
         st.session_state.owner.name = owner_name
-
-with col2:
-    available_hours = st.slider(
-        "Available hours",
-        min_value=0,
-        max_value=23,
-        value=(st.session_state.owner.available_start_hour, st.session_state.owner.available_end_hour),
-        format="%d:00"
-    )
-    st.session_state.owner.available_start_hour = available_hours[0]
-    st.session_state.owner.available_end_hour = available_hours[1]
+        st.session_state.owner.available_start_hour = available_hours[0]
+        st.session_state.owner.available_end_hour = available_hours[1]
 
 st.divider()
 
@@ -72,42 +74,59 @@ st.subheader("🐾 Pets")
 if st.session_state.owner.pets:
     st.write("**Your Pets:**")
     for i, pet in enumerate(st.session_state.owner.pets):
+        show_tasks_key = f"show_tasks_{i}"
+        show_tasks = st.session_state.get(show_tasks_key, False)
         col1, col2, col3 = st.columns([3, 2, 1])
         with col1:
             st.write(f"- **{pet.name}** ({pet.species}) - {len(pet.tasks)} task(s)")
         with col2:
             if st.button(f"View Tasks", key=f"view_tasks_{i}"):
-                st.session_state[f"show_tasks_{i}"] = not st.session_state.get(f"show_tasks_{i}", False)
+                show_tasks = not show_tasks
+                st.session_state[show_tasks_key] = show_tasks
         with col3:
             if st.button(f"Remove", key=f"remove_pet_{i}"):
                 st.session_state.owner.pets.pop(i)
                 st.rerun()
         
-        if st.session_state.get(f"show_tasks_{i}", False):
+        if show_tasks:
             if pet.tasks:
-                task_data = []
-                for task_idx, task in enumerate(pet.tasks):
-                    task_data.append({
+                task_data = [
+                    {
                         "Task": task.title,
                         "Type": task.task_type,
                         "Duration": f"{task.duration_minutes} min",
                         "Priority": task.priority,
                         "Frequency": task.frequency or "none",
-                        "Completed": "✅" if task.completed else "❌"
-                    })
-                st.dataframe(task_data, use_container_width=True)
+                        "Completed": task.completed
+                    }
+                    for task in pet.tasks
+                ]
+                
+                # One editor with a checkbox column instead of a button per task
+                editor_key = f"task_editor_{i}"
+                st.caption("Tick **Completed** to mark a task as done. Completed tasks can't be unticked.")
+                edited_data = st.data_editor(
+                    task_data,
+                    column_config={"Completed": st.column_config.CheckboxColumn("Completed")},
+                    disabled=["Task", "Type", "Duration", "Priority", "Frequency"],
+                    use_container_width=True,
+                    key=editor_key
+                )
                 
-                # Add mark complete buttons
-                st.markdown("**Mark tasks as complete:**")
-                for task_idx, task in enumerate(pet.tasks):
-                    if not task.completed:
-                        if st.button(f"✓ Complete: {task.title}", key=f"complete_{i}_{task_idx}"):
-                            pet.mark_task_complete(task.title)
-                            if task.frequency:
-                                st.success(f"✅ '{task.title}' marked complete! New {task.frequency} task created.")
-                            else:
-                                st.success(f"✅ '{task.title}' marked complete!")
-                            st.rerun()
+                # Only apply newly ticked rows (recurring copies are appended, so indices stay valid).
+                # Unticking a completed row would let a recurring task spawn a second copy when
+                # ticked again, so those edits are discarded and the editor is reset instead.
+                changed = False
+                for task_idx, row in enumerate(edited_data):
+                    task = pet.tasks[task_idx]
+                    if row["Completed"] and not task.completed:
+                        pet.mark_task_complete_by_index(task_idx)
+                        changed = True
+                    elif not row["Completed"] and task.completed:
+                        changed = True
+                if changed:
+                    st.session_state.pop(editor_key, None)
+                    st.rerun()
             else:
                 st.info("No tasks for this pet yet.")
 else:
@@ -119,7 +138,7 @@ with st.expander("➕ Add New Pet", expanded=not st.session_state.owner.pets):
     with col1:
         new_pet_name = st.text_input("Pet name", key="new_pet_name")
     with col2:
-        new_pet_species = st.selectbox("Species", ["dog", "cat", "bird", "rabbit", "other"], key="new_pet_species")
+        new_pet_species = st.selectbox("Species", SPECIES, key="new_pet_species")
     
     if st.button("Add Pet", key="add_pet_button"):
         if new_pet_name:
@@ -138,35 +157,39 @@ st.subheader("📋 Tasks")
 if not st.session_state.owner.pets:
     st.warning("Please add a pet first before adding tasks.")
 else:
-    # Select pet for task
-    pet_options = {f"{pet.name} ({pet.species})": pet for pet in st.session_state.owner.pets}
-    selected_pet_display = st.selectbox("Select pet for this task", options=list(pet_options.keys()))
-    selected_pet = pet_options[selected_pet_display]
-    
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        task_title = st.text_input("Task title", value="Morning walk", key="task_title_input")
-    with col2:
-        task_type = st.selectbox(
-            "Task type",
-            ["walk", "feeding", "meds", "enrichment", "grooming", "other"],
-            key="task_type_input"
-        )
-    with col3:
-        duration = st.number_input("Duration (minutes)", min_value=1, max_value=240, value=20, key="duration_input")
-    
-    col4, col5 = st.columns(2)
-    with col4:
-        priority = st.selectbox("Priority", ["low", "medium", "high"], index=2, key="priority_input")
-    with col5:
-        frequency = st.selectbox(
-            "Frequency (recurring)",
-            ["none", "daily", "weekly"],
-            key="frequency_input",
-            help="Select 'daily' or 'weekly' to automatically create new tasks when completed"
-        )
+    # Batch the task inputs in a form so they submit in a single rerun
+    with st.form("add_task"):
+        # Select pet for task
+        pet_options = {f"{pet.name} ({pet.species})": pet for pet in st.session_state.owner.pets}
+        selected_pet_display = st.selectbox("Select pet for this task", options=list(pet_options.keys()))
+        selected_pet = pet_options[selected_pet_display]
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            task_title = st.text_input("Task title", value="Morning walk", key="task_title_input")
+        with col2:
+            task_type = st.selectbox(
+                "Task type",
+                TASK_TYPES,
+                key="task_type_input"
+            )
+        with col3:
+            duration = st.number_input("Duration (minutes)", min_value=1, max_value=240, value=20, key="duration_input")
+        
+        col4, col5 = st.columns(2)
+        with col4:
+            priority = st.selectbox("Priority", PRIORITIES, index=2, key="priority_input")
+        with col5:
+            frequency = st.selectbox(
+                "Frequency (recurring)",
+                ["none", "daily", "weekly"],
+                key="frequency_input",
+                help="Select 'daily' or 'weekly' to automatically create new tasks when completed"
+            )
+        
+        submitted = st.form_submit_button("Add Task")
     
-    if st.button("Add Task", key="add_task_button"):
+    if submitted:
         if task_title:
             new_task = Task(
                 title=task_title,
@@ -184,6 +207,62 @@ else:
 
 st.divider()
 
+
+def owner_signature(owner: Owner) -> tuple:
+    """Returns a hashable snapshot of the owner state that generate_schedule reads."""
+    # id(t) makes re-added tasks with identical fields count as new, so they get scheduled times
+    return (
+        owner.available_start_hour,
+        owner.available_end_hour,
+        tuple(
+            (pet.name, tuple(
+                (id(t), t.title, t.task_type, t.duration_minutes, t.priority, t.completed) for t in pet.tasks
+            ))
+            for pet in owner.pets
+        ),
+    )
+
+
+@st.fragment
+def render_view_options():
+    """Renders the filter/sort options; widget changes rerun only this fragment."""
+    with st.expander("🔍 View Options"):
+        col1, col2 = st.columns(2)
+        with col1:
+            filter_pet = st.selectbox(
+                "Filter by Pet",
+                options=["All"] + [pet.name for pet in st.session_state.owner.pets],
+                key="filter_pet_select"
+            )
+        with col2:
+            show_completed = st.checkbox("Show completed tasks", value=False, key="show_completed_check")
+
+        if filter_pet != "All" or not show_completed:
+            # Apply filters
+            all_tasks = st.session_state.owner.get_all_tasks()
+            filtered_tasks = st.session_state.scheduler.filter_tasks(
+                all_tasks,
+                completed=None if show_completed else False,
+                pet_name=None if filter_pet == "All" else filter_pet
+            )
+
+            if filtered_tasks:
+                st.markdown("**Filtered Tasks:**")
+                pet_names = {id(task): pet.name for pet in st.session_state.owner.pets for task in pet.tasks}
+                filtered_data = {
+                    "Task": [task.title for task in filtered_tasks],
+                    "Pet": [pet_names.get(id(task), "Unknown") for task in filtered_tasks],
+                    "Type": [task.task_type for task in filtered_tasks],
+                    "Duration": [f"{task.duration_minutes} min" for task in filtered_tasks],
+                    "Priority": [task.priority for task in filtered_tasks],
+                    "Status": ["✅ Complete" if task.completed else "❌ Incomplete" for task in filtered_tasks],
+                    "Scheduled": [task.get_scheduled_time_str() or "Not scheduled" for task in filtered_tasks]
+                }
+                st.dataframe(filtered_data, use_container_width=True)
+            else:
+                st.info("No tasks match the selected filters.")
+
+
 # Schedule Generation Section
 st.subheader("📅 Generate Schedule")
 
@@ -193,15 +272,21 @@ elif not any(pet.tasks for pet in st.session_state.owner.pets):
     st.info("Add tasks to your pets to generate a schedule.")
 else:
     if st.button("Generate Schedule", type="primary"):
-        scheduler = Scheduler(owner=st.session_state.owner)
-        schedule = scheduler.generate_schedule()
-        
-        # Store schedule and explanation in session state
-        st.session_state.schedule = schedule
-        st.session_state.schedule_explanation = scheduler.explain_plan()
-        st.session_state.scheduler = scheduler
-        
-        st.rerun()
+        # Only rebuild the schedule if the availability, pets or tasks changed since last time
+        signature = owner_signature(st.session_state.owner)
+        if signature != st.session_state.get("schedule_signature"):
+            scheduler = Scheduler(owner=st.session_state.owner)
+            schedule = scheduler.generate_schedule()
+            
+            # Store schedule and explanation in session state
+            st.session_state.schedule = schedule
+            st.session_state.schedule_explanation = scheduler.explain_plan()
+            st.session_state.scheduler = scheduler
+            st.session_state.schedule_signature = signature
+            # Keep the signed tasks alive so their ids can't be reused by new tasks
+            st.session_state.schedule_signature_tasks = st.session_state.owner.get_all_tasks()
+            
+            st.rerun()
     
     # Display schedule if it exists in session state
     if "schedule" in st.session_state and st.session_state.schedule:
@@ -216,55 +301,20 @@ else:
         
         # Display schedule (already sorted by time from generate_schedule)
         st.markdown("### Today's Schedule")
-        schedule_data = []
-        for item in st.session_state.schedule:
-            schedule_data.append({
-                "Time": item["scheduled_time"],
-                "Task": item["task"],
-                "Pet": item["pet"],
-                "Type": item["type"],
-                "Duration": f"{item['duration']} min",
-                "Priority": item["priority"]
-            })
+        # Build the table column by column so each column is converted in one go
+        schedule = st.session_state.schedule
+        schedule_data = {
+            "Time": [item.scheduled_time for item in schedule],
+            "Task": [item.task for item in schedule],
+            "Pet": [item.pet for item in schedule],
+            "Type": [item.type for item in schedule],
+            "Duration": [f"{item.duration} min" for item in schedule],
+            "Priority": [item.priority for item in schedule]
+        }
         st.dataframe(schedule_data, use_container_width=True)
         
-        # Add filtering and sorting options
-        with st.expander("🔍 View Options"):
-            col1, col2 = st.columns(2)
-            with col1:
-                filter_pet = st.selectbox(
-                    "Filter by Pet",
-                    options=["All"] + [pet.name for pet in st.session_state.owner.pets],
-                    key="filter_pet_select"
-                )
-            with col2:
-                show_completed = st.checkbox("Show completed tasks", value=False, key="show_completed_check")
-            
-            if filter_pet != "All" or not show_completed:
-                # Apply filters
-                all_tasks = st.session_state.owner.get_all_tasks()
-                filtered_tasks = st.session_state.scheduler.filter_tasks(
-                    all_tasks,
-                    completed=None if show_completed else False,
-                    pet_name=None if filter_pet == "All" else filter_pet
-                )
-                
-                if filtered_tasks:
-                    st.markdown("**Filtered Tasks:**")
-                    filtered_data = []
-                    for task in filtered_tasks:
-                        filtered_data.append({
-                            "Task": task.title,
-                            "Pet": next((p.name for p in st.session_state.owner.pets if task in p.get_tasks()), "Unknown"),
-                            "Type": task.task_type,
-                            "Duration": f"{task.duration_minutes} min",
-                            "Priority": task.priority,
-                            "Status": "✅ Complete" if task.completed else "❌ Incomplete",
-                            "Scheduled": task.get_scheduled_time_str() if task.scheduled_time else "Not scheduled"
-                        })
-                    st.dataframe(filtered_data, use_container_width=True)
-                else:
-                    st.info("No tasks match the selected filters.")
+        # Filtering options rerun as a fragment, without re-rendering the page
+        render_view_options()
         
         # Display explanation
         with st.expander("📝 Schedule Explanation"):
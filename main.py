@@ -142,11 +142,14 @@ def main():
         print("Scheduled Tasks:")
         print("-" * 60)
         
-        for item in schedule:
-            print(f"⏰ {item['scheduled_time']} | {item['task']:20s} | "
-                  f"Pet: {item['pet']:10s} | "
-                  f"Priority: {item['priority']:6s} | "
-                  f"Duration: {item['duration']} min")
+        lines = [
+            f"⏰ {item.scheduled_time} | {item.task:20s} | "
+            f"Pet: {item.pet:10s} | "
+            f"Priority: {item.priority:6s} | "
+            f"Duration: {item.duration} min"
+            for item in schedule
+        ]
+        print("\n".join(lines))
         
         print("-" * 60)
         print()
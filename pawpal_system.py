@@ -5,15 +5,45 @@ This module contains the core classes for the pet care planning system:
 - Owner: Represents the pet owner with availability and preferences
 - Pet: Represents a pet with basic information
 - Task: Represents a pet care task with duration and priority
+- ScheduleItem: One scheduled task entry in a generated daily plan
 - Scheduler: Generates daily schedules based on constraints
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
-from datetime import datetime, timedelta
+from itertools import chain
+from typing import List, Dict, Tuple, Optional, NamedTuple, Union
 
 
-@dataclass
+# Fixed vocabularies offered by the UI (string literals, so CPython already interns them)
+SPECIES = ("dog", "cat", "bird", "rabbit", "other")
+TASK_TYPES = ("walk", "feeding", "meds", "enrichment", "grooming", "other")
+PRIORITIES = ("low", "medium", "high")
+
+# Integer codes for priority strings, used for sorting and comparisons
+PRIORITY_CODES = {"low": 0, "medium": 1, "high": 2}
+
+# Preformatted "HH:MM" strings, indexed by minute of the day
+_HHMM = tuple(f"{h:02d}:{m:02d}" for h in range(24) for m in range(60))
+
+# Static part of Scheduler.explain_plan() that follows the availability line
+_EXPLANATION_CRITERIA = (
+    "Tasks were scheduled based on:",
+    "1. Priority (high priority tasks scheduled first)",
+    "2. Duration (shorter tasks scheduled first within same priority)",
+    "3. Available time window",
+    "",
+    "Scheduled tasks:",
+)
+
+
+def _intern(value: str) -> str:
+    """Interns an exact str; other values are returned unchanged."""
+    # sys.intern raises TypeError for str subclasses such as numpy.str_
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a pet care task with duration, priority, and completion status."""
     title: str
@@ -24,14 +54,18 @@ class Task:
     completed: bool = False
     frequency: Optional[str] = None  # e.g., "daily", "twice_daily", "weekly"
     
+    def __post_init__(self) -> None:
+        """Interns the vocabulary strings so repeated values share one object."""
+        self.priority = _intern(self.priority)
+        self.task_type = _intern(self.task_type)
+    
     def get_duration(self) -> int:
         """Returns duration in minutes."""
         return self.duration_minutes
     
     def get_priority_value(self) -> int:
         """Returns numeric priority value (1=low, 2=medium, 3=high)."""
-        priority_map = {"low": 1, "medium": 2, "high": 3}
-        return priority_map.get(self.priority.lower(), 1)
+        return PRIORITY_CODES.get(self.priority.lower(), 0) + 1
     
     def mark_complete(self) -> Optional['Task']:
         """Marks the task as completed. Returns a new task instance if frequency is set."""
@@ -61,7 +95,7 @@ class Task:
         return ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Pet:
     """Represents a pet with basic information and a list of tasks."""
     name: str
@@ -69,6 +103,10 @@ class Pet:
     owner: 'Owner'
     tasks: List[Task] = field(default_factory=list)
     
+    def __post_init__(self) -> None:
+        """Interns the species string."""
+        self.species = _intern(self.species)
+    
     def get_info(self) -> Dict[str, str]:
         """Returns dictionary with pet information."""
         return {
@@ -92,21 +130,57 @@ class Pet:
     
     def get_tasks(self) -> List[Task]:
         """Returns list of all tasks for this pet."""
+        # The live list, not a copy: treat it as read-only and use add_task/remove_task to change it
         return self.tasks
     
     def mark_task_complete(self, task_title: str) -> bool:
-        """Marks a task as complete and handles recurring tasks. Returns True if task was found."""
-        for task in self.tasks:
-            if task.title == task_title:
+        """Marks the first incomplete task with this title complete. Returns True if one was found."""
+        task = self._find_open_task(task_title)
+        if task is None:
+            return False
+        self._complete_task(task)
+        return True
+    
+    def bulk_mark_complete(self, task_titles: List[str]) -> int:
+        """Marks the first incomplete task for each title complete. Returns number completed."""
+        new_tasks = []
+        completed_count = 0
+        for task_title in task_titles:
+            task = self._find_open_task(task_title)
+            if task is not None:
                 new_task = task.mark_complete()
                 if new_task:
-                    # Add new recurring task instance
-                    self.add_task(new_task)
-                return True
+                    new_tasks.append(new_task)
+                completed_count += 1
+        
+        # Append all new recurring instances at once
+        self.tasks.extend(new_tasks)
+        
+        return completed_count
+    
+    def mark_task_complete_by_index(self, task_index: int) -> bool:
+        """Marks the task at task_index complete. Returns True if the index was valid."""
+        if 0 <= task_index < len(self.tasks):
+            self._complete_task(self.tasks[task_index])
+            return True
         return False
+    
+    def _find_open_task(self, task_title: str) -> Optional[Task]:
+        """Helper method to find the first incomplete task with this title, or None."""
+        for task in self.tasks:
+            if task.title == task_title and not task.completed:
+                return task
+        return None
+    
+    def _complete_task(self, task: Task) -> None:
+        """Helper method to complete a task and add its next recurring instance, if any."""
+        new_task = task.mark_complete()
+        if new_task:
+            # Add new recurring task instance
+            self.add_task(new_task)
 
 
-@dataclass
+@dataclass(slots=True)
 class Owner:
     """Represents a pet owner with availability, preferences, and multiple pets."""
     name: str
@@ -119,6 +193,10 @@ class Owner:
         """Returns tuple of (start_hour, end_hour) for owner's available time."""
         return (self.available_start_hour, self.available_end_hour)
     
+    def get_available_minutes(self) -> int:
+        """Returns the length of the owner's available window in minutes."""
+        return (self.available_end_hour - self.available_start_hour) * 60
+    
     def update_preferences(self, prefs: Dict[str, any]) -> None:
         """Updates owner preferences dictionary."""
         self.preferences.update(prefs)
@@ -129,24 +207,40 @@ class Owner:
     
     def get_all_tasks(self) -> List[Task]:
         """Returns a list of all tasks from all pets."""
-        all_tasks = []
-        for pet in self.pets:
-            all_tasks.extend(pet.get_tasks())
-        return all_tasks
+        return list(chain.from_iterable(pet.tasks for pet in self.pets))
     
     def get_pets(self) -> List[Pet]:
         """Returns list of all pets."""
         return self.pets
 
 
+class ScheduleItem(NamedTuple):
+    """One entry in a generated daily plan. Supports item.field and item["field"] access."""
+    task: str
+    pet: str
+    type: str
+    duration: int
+    priority: str
+    scheduled_time: str  # "HH:MM"
+    scheduled_hour: int
+    start_minute: int  # Minutes since midnight, so conflict checks skip parsing scheduled_time
+    
+    def __getitem__(self, key):
+        """Looks up a field by name (dict-style) or by position (tuple-style)."""
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
 class Scheduler:
     """Generates daily schedules for pet care tasks based on constraints."""
     
     def __init__(self, owner: Owner):
         """Initialize scheduler with owner."""
         self.owner = owner
-        self.daily_plan: List[Dict] = []
+        self.daily_plan: List[ScheduleItem] = []
         self.conflict_warnings: List[str] = []
+        self._explanation: Optional[str] = None  # Cached explain_plan() output
     
     def add_task(self, task: Task, pet: Pet) -> None:
         """Adds a task to a pet's task list."""
@@ -158,125 +252,178 @@ class Scheduler:
     
     def sort_by_time(self, tasks: List[Task]) -> List[Task]:
         """Sorts tasks by their scheduled time (HH:MM format). Unscheduled tasks go to the end."""
-        def time_key(task: Task) -> Tuple[int, int]:
-            """Returns (hour, minute) tuple for sorting, or (999, 999) for unscheduled tasks."""
-            if task.scheduled_time is not None:
-                return (task.scheduled_time, 0)
-            return (999, 999)  # Put unscheduled tasks at the end
-        
-        return sorted(tasks, key=time_key)
+        return sorted(tasks, key=self._time_key)
+    
+    @staticmethod
+    def _time_key(task: Task) -> Tuple[bool, int]:
+        """Returns (is_unscheduled, hour) for sorting, so unscheduled tasks go to the end."""
+        scheduled_time = task.scheduled_time
+        return (scheduled_time is None, scheduled_time if scheduled_time is not None else 0)
     
     def filter_tasks(self, tasks: List[Task], completed: Optional[bool] = None, pet_name: Optional[str] = None) -> List[Task]:
-        """Filters tasks by completion status and/or pet name."""
-        filtered = tasks
-        
-        # Filter by completion status
-        if completed is not None:
-            filtered = [task for task in filtered if task.completed == completed]
-        
-        # Filter by pet name
+        """Filters tasks by completion status and/or pet name (case-insensitive)."""
+        # Resolve the pet filter to the ids of the matching pets' tasks up front
+        pet_task_ids = None
         if pet_name is not None:
-            pet_tasks = []
-            for pet in self.owner.get_pets():
-                if pet.name.lower() == pet_name.lower():
-                    pet_tasks.extend([task for task in filtered if task in pet.get_tasks()])
-            filtered = pet_tasks
+            target = pet_name.casefold()
+            pet_task_ids = {
+                id(task)
+                for pet in self.owner.get_pets() if pet.name.casefold() == target
+                for task in pet.get_tasks()
+            }
         
-        return filtered
+        # Apply both criteria in a single pass
+        return [
+            task for task in tasks
+            if (completed is None or task.completed == completed)
+            and (pet_task_ids is None or id(task) in pet_task_ids)
+        ]
     
-    def detect_conflicts(self, schedule: List[Dict]) -> List[str]:
+    def detect_conflicts(self, schedule: List[Union[ScheduleItem, Dict]]) -> List[str]:
         """Detects scheduling conflicts where tasks overlap in time. Returns list of warning messages."""
+        # Accepts ScheduleItems or plain dicts with the same keys
         warnings = []
         
-        # Group tasks by scheduled time
+        # Convert schedule items to integer start/end minutes, grouping them by start time
+        starts = []
+        ends = []
         time_slots = {}
         for item in schedule:
-            time_key = item["scheduled_time"]
-            if time_key not in time_slots:
-                time_slots[time_key] = []
-            time_slots[time_key].append(item)
+            if isinstance(item, ScheduleItem):
+                start_minute = item.start_minute
+            else:
+                start_minute = self._parse_minutes(item["scheduled_time"])
+            starts.append(start_minute)
+            ends.append(start_minute + item["duration"])
+            time_slots.setdefault(item["scheduled_time"], []).append(item)
         
-        # Check for conflicts (same time or overlapping durations)
+        # One warning per start time shared by multiple tasks
         for time_slot, items in time_slots.items():
             if len(items) > 1:
-                # Multiple tasks at the same time
-                pet_names = [item["pet"] for item in items]
-                task_names = [item["task"] for item in items]
+                pet_names = dict.fromkeys(item["pet"] for item in items)  # De-duplicated, in order
                 warnings.append(
                     f"⚠️ Conflict at {time_slot}: Multiple tasks scheduled - "
-                    f"{', '.join(task_names)} for pets {', '.join(set(pet_names))}"
+                    f"{', '.join(item['task'] for item in items)} for pets {', '.join(pet_names)}"
+                )
+        
+        # Overlapping tasks that start at different times are reported pair by pair
+        for idx1, idx2 in self._scan_conflicts(starts, ends):
+            item1 = schedule[idx1]
+            item2 = schedule[idx2]
+            if item1["scheduled_time"] != item2["scheduled_time"]:
+                warnings.append(
+                    f"⚠️ Overlap detected: '{item1['task']}' ({item1['pet']}) and "
+                    f"'{item2['task']}' ({item2['pet']}) overlap in time"
                 )
-            
-            # Check for overlapping durations
-            for i, item1 in enumerate(items):
-                for item2 in items[i+1:]:
-                    # Calculate end times
-                    start_time1 = self._parse_time(item1["scheduled_time"])
-                    end_time1 = start_time1 + timedelta(minutes=item1["duration"])
-                    start_time2 = self._parse_time(item2["scheduled_time"])
-                    end_time2 = start_time2 + timedelta(minutes=item2["duration"])
-                    
-                    # Check if times overlap
-                    if not (end_time1 <= start_time2 or end_time2 <= start_time1):
-                        warnings.append(
-                            f"⚠️ Overlap detected: '{item1['task']}' ({item1['pet']}) and "
-                            f"'{item2['task']}' ({item2['pet']}) overlap in time"
-                        )
         
         return warnings
     
-    def _parse_time(self, time_str: str) -> datetime:
-        """Helper method to parse HH:MM time string into datetime object."""
-        hour, minute = map(int, time_str.split(":"))
-        return datetime(2000, 1, 1, hour, minute)
+    @staticmethod
+    def _scan_conflicts(starts: List[int], ends: List[int]) -> List[Tuple[int, int]]:
+        """Sweep-line over integer intervals. Returns every overlapping (earlier, later) index pair."""
+        # One start and one end event per interval; ends sort before starts at the same
+        # minute so back-to-back tasks don't count as overlapping
+        events = []
+        for idx in range(len(starts)):
+            if starts[idx] < ends[idx]:  # Zero-length tasks occupy no time
+                events.append((starts[idx], 1, idx))
+                events.append((ends[idx], 0, idx))
+        events.sort()
+        
+        pairs = []
+        open_intervals = {}  # Insertion-ordered set of intervals in progress
+        for _, is_start, idx in events:
+            if is_start:
+                pairs.extend((other, idx) for other in open_intervals)
+                open_intervals[idx] = None
+            else:
+                del open_intervals[idx]
+        
+        return pairs
+    
+    @staticmethod
+    def _parse_minutes(time_str: str) -> int:
+        """Helper method to parse HH:MM time string into minutes since midnight."""
+        hour, minute = time_str.split(":")
+        return int(hour) * 60 + int(minute)
+    
+    def _materialize(self) -> Tuple[List[Task], List[str], List[int], List[int]]:
+        """Snapshots incomplete tasks as parallel lists: (tasks, pet names, durations, priority codes)."""
+        tasks = []
+        pet_names = []
+        for pet in self.owner.get_pets():
+            for task in pet.get_tasks():
+                if not task.completed:
+                    tasks.append(task)
+                    pet_names.append(pet.name)
+        durations = [task.duration_minutes for task in tasks]
+        priorities = [PRIORITY_CODES.get(task.priority.lower(), 0) for task in tasks]
+        return tasks, pet_names, durations, priorities
+    
+    @staticmethod
+    def _pack(order: List[int], durations: List[int], available_minutes: int) -> List[Tuple[int, int]]:
+        """Greedily packs tasks back to back. Returns (index, start offset in minutes) pairs."""
+        placements = []
+        current_time_minutes = 0
+        shortest = min(durations, default=0)
+        
+        for i in order:
+            # Stop once not even the shortest task fits in the time left
+            if available_minutes - current_time_minutes < shortest:
+                break
+            duration = durations[i]
+            if current_time_minutes + duration <= available_minutes:
+                placements.append((i, current_time_minutes))
+                current_time_minutes += duration
+        
+        return placements
     
-    def generate_schedule(self) -> List[Dict]:
+    def generate_schedule(self) -> List[ScheduleItem]:
         """Creates daily schedule based on constraints and priorities."""
-        # Get all tasks from all pets
-        all_tasks = self.owner.get_all_tasks()
+        # Snapshot incomplete tasks from all pets into parallel lists
+        tasks, pet_names, durations, priorities = self._materialize()
         
-        # Filter out completed tasks
-        incomplete_tasks = [task for task in all_tasks if not task.completed]
+        if not tasks:
+            # Every task is complete (or there are none): skip ordering, packing and conflict checks
+            self.daily_plan = []
+            self.conflict_warnings = []
+            self._explanation = None
+            return self.daily_plan
         
-        # Sort by priority (high to low), then by duration (shorter first)
-        sorted_tasks = sorted(
-            incomplete_tasks,
-            key=lambda t: (-t.get_priority_value(), t.duration_minutes)
-        )
+        # Partition into the three priority buckets, then order each bucket by duration (shorter first)
+        buckets = ([], [], [])  # indexed by priority code: low, medium, high
+        for i, code in enumerate(priorities):
+            buckets[code].append(i)
+        order = []
+        for bucket in reversed(buckets):  # high to low
+            bucket.sort(key=durations.__getitem__)
+            order.extend(bucket)
         
         # Schedule tasks within available time window
-        start_hour, end_hour = self.owner.get_available_time()
-        available_minutes = (end_hour - start_hour) * 60
-        current_time_minutes = 0
+        start_hour = self.owner.available_start_hour
+        available_minutes = self.owner.get_available_minutes()
         scheduled = []
         
-        for task in sorted_tasks:
-            if current_time_minutes + task.duration_minutes <= available_minutes:
-                scheduled_hour = start_hour + (current_time_minutes // 60)
-                scheduled_minute = current_time_minutes % 60
-                
-                task.scheduled_time = scheduled_hour
-                
-                # Find which pet this task belongs to
-                pet_name = "Unknown"
-                for pet in self.owner.get_pets():
-                    if task in pet.get_tasks():
-                        pet_name = pet.name
-                        break
-                
-                scheduled.append({
-                    "task": task.title,
-                    "pet": pet_name,
-                    "type": task.task_type,
-                    "duration": task.duration_minutes,
-                    "priority": task.priority,
-                    "scheduled_time": f"{scheduled_hour:02d}:{scheduled_minute:02d}",
-                    "scheduled_hour": scheduled_hour
-                })
-                
-                current_time_minutes += task.duration_minutes
+        for i, offset_minutes in self._pack(order, durations, available_minutes):
+            task = tasks[i]
+            start_minute = start_hour * 60 + offset_minutes
+            scheduled_hour, scheduled_minute = divmod(start_minute, 60)
+            
+            task.scheduled_time = scheduled_hour
+            
+            scheduled.append(ScheduleItem(
+                task=task.title,
+                pet=pet_names[i],
+                type=task.task_type,
+                duration=durations[i],
+                priority=task.priority,
+                scheduled_time=_HHMM[start_minute] if start_minute < len(_HHMM) else f"{scheduled_hour:02d}:{scheduled_minute:02d}",
+                scheduled_hour=scheduled_hour,
+                start_minute=start_minute
+            ))
         
         self.daily_plan = scheduled
+        self._explanation = None
         
         # Detect and report conflicts
         conflicts = self.detect_conflicts(scheduled)
@@ -289,18 +436,25 @@ class Scheduler:
     
     def explain_plan(self) -> str:
         """Returns explanation of why tasks were scheduled as they were."""
+        if self._explanation is None:
+            self._explanation = "\n".join(self._build_explanation_lines())
+        return self._explanation
+    
+    def _build_explanation_lines(self) -> List[str]:
+        """Helper method that builds the lines of the plan explanation."""
         if not self.daily_plan:
-            return "No tasks scheduled. Add tasks to pets to generate a schedule."
+            return ["No tasks scheduled. Add tasks to pets to generate a schedule."]
         
-        explanation = "Today's Schedule Explanation:\n\n"
-        explanation += f"Available time: {self.owner.available_start_hour:02d}:00 - {self.owner.available_end_hour:02d}:00\n\n"
-        explanation += "Tasks were scheduled based on:\n"
-        explanation += "1. Priority (high priority tasks scheduled first)\n"
-        explanation += "2. Duration (shorter tasks scheduled first within same priority)\n"
-        explanation += "3. Available time window\n\n"
-        explanation += "Scheduled tasks:\n"
-        
-        for item in self.daily_plan:
-            explanation += f"- {item['scheduled_time']}: {item['task']} ({item['pet']}) - {item['priority']} priority, {item['duration']} min\n"
-        
-        return explanation
+        lines = [
+            "Today's Schedule Explanation:",
+            "",
+            f"Available time: {self.owner.available_start_hour:02d}:00 - {self.owner.available_end_hour:02d}:00",
+            "",
+            *_EXPLANATION_CRITERIA,
+        ]
+        lines.extend(
+            f"- {item.scheduled_time}: {item.task} ({item.pet}) - {item.priority} priority, {item.duration} min"
+            for item in self.daily_plan
+        )
+        lines.append("")  # Keep the trailing newline
+        return lines
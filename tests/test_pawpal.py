@@ -10,7 +10,7 @@ Tests cover:
 """
 
 import pytest
-from pawpal_system import Owner, Pet, Task, Scheduler
+from pawpal_system import Owner, Pet, Task, Scheduler, ScheduleItem
 
 
 def test_task_completion():
@@ -112,6 +112,11 @@ def test_scheduler_generates_schedule():
     assert len(schedule) == 1
     assert schedule[0]["task"] == "Morning walk"
     assert schedule[0]["pet"] == "Mochi"
+    
+    # Schedule entries are ScheduleItems with attribute access too
+    assert isinstance(schedule[0], ScheduleItem)
+    assert schedule[0].scheduled_time == "08:00"
+    assert schedule[0].duration == 30
 
 
 def test_sorting_correctness():
@@ -146,6 +151,25 @@ def test_sorting_correctness():
     assert sorted_tasks[3].title == "Unscheduled task"
 
 
+def test_reassigned_priority_is_used_for_scheduling():
+    """Verify changing task.priority after construction updates its value and its place in the schedule."""
+    owner = Owner(name="Jordan", available_start_hour=8, available_end_hour=20)
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    owner.add_pet(pet)
+    walk = Task(title="Walk", duration_minutes=30, priority="high", task_type="walk")
+    grooming = Task(title="Grooming", duration_minutes=20, priority="low", task_type="grooming")
+    pet.add_task(walk)
+    pet.add_task(grooming)
+    
+    grooming.priority = "high"
+    walk.priority = "low"
+    
+    assert grooming.get_priority_value() == 3
+    assert walk.get_priority_value() == 1
+    schedule = Scheduler(owner=owner).generate_schedule()
+    assert [item["task"] for item in schedule] == ["Grooming", "Walk"]
+
+
 def test_recurrence_logic():
     """Confirm that marking a daily task complete creates a new task for the following day."""
     owner = Owner(name="Jordan")
@@ -376,6 +400,7 @@ def test_edge_case_tasks_exceed_available_time():
     total_scheduled_minutes = sum(item["duration"] for item in schedule)
     available_minutes = (owner.available_end_hour - owner.available_start_hour) * 60
     assert total_scheduled_minutes <= available_minutes
+    assert owner.get_available_minutes() == available_minutes
 
 
 def test_filter_tasks_by_completion():
@@ -434,3 +459,280 @@ def test_filter_tasks_by_pet_name():
     whiskers_tasks = scheduler.filter_tasks(all_tasks, pet_name="whiskers")  # lowercase
     assert len(whiskers_tasks) == 1
     assert task2 in whiskers_tasks
+    
+    # Unicode case folding ("ß" matches "SS")
+    pet3 = Pet(name="Strauß", species="bird", owner=owner)
+    owner.add_pet(pet3)
+    task3 = Task(title="Seed refill", duration_minutes=5, priority="low", task_type="feeding")
+    pet3.add_task(task3)
+    assert scheduler.filter_tasks(owner.get_all_tasks(), pet_name="STRAUSS") == [task3]
+
+
+def test_conflict_detection_chained_overlaps():
+    """Verify that every task overlapping an earlier one is reported, regardless of input order."""
+    owner = Owner(name="Jordan")
+    scheduler = Scheduler(owner=owner)
+    
+    # Task 1: 09:00-10:30, Task 2: 10:00-10:20, Task 3: 10:25-10:40, Task 4: 11:00-11:10
+    schedule = [
+        {"task": "Grooming", "pet": "Whiskers", "type": "grooming", "duration": 15,
+         "priority": "low", "scheduled_time": "10:25", "scheduled_hour": 10},
+        {"task": "Long walk", "pet": "Mochi", "type": "walk", "duration": 90,
+         "priority": "high", "scheduled_time": "09:00", "scheduled_hour": 9},
+        {"task": "Feeding", "pet": "Whiskers", "type": "feeding", "duration": 20,
+         "priority": "high", "scheduled_time": "10:00", "scheduled_hour": 10},
+        {"task": "Meds", "pet": "Mochi", "type": "meds", "duration": 10,
+         "priority": "high", "scheduled_time": "11:00", "scheduled_hour": 11},
+    ]
+    
+    conflicts = scheduler.detect_conflicts(schedule)
+    
+    # Feeding and Grooming both overlap the long walk; Meds is clear
+    assert len(conflicts) == 2
+    assert all("Long walk" in conflict for conflict in conflicts)
+    assert not any("Meds" in conflict for conflict in conflicts)
+
+
+def test_mark_task_complete_by_index():
+    """Verify completing by index targets that exact task, even when titles repeat."""
+    owner = Owner(name="Jordan")
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    owner.add_pet(pet)
+    
+    first = Task(title="Walk", duration_minutes=30, priority="high", task_type="walk")
+    second = Task(title="Walk", duration_minutes=20, priority="low", task_type="walk", frequency="daily")
+    pet.add_task(first)
+    pet.add_task(second)
+    
+    assert pet.mark_task_complete_by_index(1) == True
+    assert first.completed == False
+    assert second.completed == True
+    # Recurring task spawned a new instance
+    assert len(pet.get_tasks()) == 3
+    
+    # Out-of-range index is rejected
+    assert pet.mark_task_complete_by_index(5) == False
+
+
+def test_explain_plan_refreshes_after_regenerating():
+    """Verify explain_plan lists scheduled tasks and reflects a regenerated schedule."""
+    owner = Owner(name="Jordan", available_start_hour=8, available_end_hour=20)
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    owner.add_pet(pet)
+    pet.add_task(Task(title="Morning walk", duration_minutes=30, priority="high", task_type="walk"))
+    
+    scheduler = Scheduler(owner=owner)
+    assert scheduler.explain_plan().startswith("No tasks scheduled")
+    
+    scheduler.generate_schedule()
+    explanation = scheduler.explain_plan()
+    assert "- 08:00: Morning walk (Mochi) - high priority, 30 min" in explanation
+    
+    pet.add_task(Task(title="Feeding", duration_minutes=10, priority="high", task_type="feeding"))
+    scheduler.generate_schedule()
+    assert "Feeding (Mochi)" in scheduler.explain_plan()
+
+
+def test_schedule_attributes_identical_tasks_to_their_own_pet():
+    """Verify each scheduled task is labelled with the pet it was added to, even if tasks look alike."""
+    owner = Owner(name="Jordan", available_start_hour=8, available_end_hour=20)
+    pet1 = Pet(name="Mochi", species="dog", owner=owner)
+    pet2 = Pet(name="Biscuit", species="dog", owner=owner)
+    owner.add_pet(pet1)
+    owner.add_pet(pet2)
+    
+    # Same field values for both pets
+    pet1.add_task(Task(title="Walk", duration_minutes=30, priority="high", task_type="walk"))
+    pet2.add_task(Task(title="Walk", duration_minutes=30, priority="high", task_type="walk"))
+    
+    scheduler = Scheduler(owner=owner)
+    schedule = scheduler.generate_schedule()
+    
+    assert sorted(item["pet"] for item in schedule) == ["Biscuit", "Mochi"]
+
+
+def test_remove_task_by_title():
+    """Verify remove_task drops only the first task with that title and reports missing titles."""
+    owner = Owner(name="Jordan")
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    
+    first = Task(title="Walk", duration_minutes=30, priority="high", task_type="walk")
+    feeding = Task(title="Feeding", duration_minutes=10, priority="high", task_type="feeding")
+    second = Task(title="Walk", duration_minutes=20, priority="low", task_type="walk")
+    pet.add_task(first)
+    pet.add_task(feeding)
+    pet.add_task(second)
+    
+    assert pet.remove_task("Walk") == True
+    assert pet.get_tasks() == [feeding, second]
+    assert pet.get_tasks()[1] is second
+    
+    assert pet.remove_task("Walk") == True
+    assert pet.remove_task("Walk") == False
+    assert pet.get_tasks() == [feeding]
+    
+    # Completing by title still works after removals
+    assert pet.mark_task_complete("Feeding") == True
+    assert feeding.completed == True
+    assert pet.mark_task_complete("Walk") == False
+
+
+def test_conflict_detection_reports_every_overlapping_pair():
+    """Verify all mutually overlapping tasks are reported, while back-to-back tasks are not."""
+    owner = Owner(name="Jordan")
+    scheduler = Scheduler(owner=owner)
+    
+    # A: 09:00-11:00, B: 10:00-12:00, C: 10:30-10:45 all overlap each other; D starts as B ends
+    schedule = [
+        {"task": "A", "pet": "Mochi", "type": "walk", "duration": 120,
+         "priority": "high", "scheduled_time": "09:00", "scheduled_hour": 9},
+        {"task": "B", "pet": "Whiskers", "type": "enrichment", "duration": 120,
+         "priority": "medium", "scheduled_time": "10:00", "scheduled_hour": 10},
+        {"task": "C", "pet": "Mochi", "type": "meds", "duration": 15,
+         "priority": "high", "scheduled_time": "10:30", "scheduled_hour": 10},
+        {"task": "D", "pet": "Whiskers", "type": "feeding", "duration": 10,
+         "priority": "high", "scheduled_time": "12:00", "scheduled_hour": 12},
+    ]
+    
+    conflicts = scheduler.detect_conflicts(schedule)
+    
+    assert len(conflicts) == 3
+    assert any("'A'" in c and "'C'" in c for c in conflicts)
+    assert not any("'D'" in c for c in conflicts)
+
+
+def test_recurrence_completes_next_open_instance():
+    """Verify repeated completion by title advances through recurring instances instead of re-completing the first."""
+    owner = Owner(name="Jordan")
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    owner.add_pet(pet)
+    pet.add_task(Task(title="Daily medication", duration_minutes=5, priority="high", task_type="meds", frequency="daily"))
+    
+    assert pet.mark_task_complete("Daily medication") == True
+    assert pet.mark_task_complete("Daily medication") == True
+    
+    # Two completed instances and one open instance for the next day
+    tasks = pet.get_tasks()
+    assert len(tasks) == 3
+    assert [t.completed for t in tasks] == [True, True, False]
+
+
+def test_bulk_mark_complete():
+    """Verify bulk completion marks one open task per title and adds recurring instances together."""
+    owner = Owner(name="Jordan")
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    owner.add_pet(pet)
+    
+    meds = Task(title="Daily medication", duration_minutes=5, priority="high", task_type="meds", frequency="daily")
+    walk = Task(title="Walk", duration_minutes=30, priority="high", task_type="walk", frequency="daily")
+    grooming = Task(title="Grooming", duration_minutes=20, priority="low", task_type="grooming")
+    pet.add_task(meds)
+    pet.add_task(walk)
+    pet.add_task(grooming)
+    
+    completed = pet.bulk_mark_complete(["Daily medication", "Walk", "Grooming", "Missing"])
+    
+    assert completed == 3
+    assert meds.completed and walk.completed and grooming.completed
+    # Two recurring instances were appended, both open
+    new_tasks = pet.get_tasks()[3:]
+    assert [t.title for t in new_tasks] == ["Daily medication", "Walk"]
+    assert all(not t.completed for t in new_tasks)
+    
+    # The new instances are reachable by title
+    assert pet.mark_task_complete("Walk") == True
+    assert new_tasks[1].completed == True
+
+
+def test_tasks_appended_directly_are_still_found():
+    """Verify tasks appended to pet.tasks without add_task can be completed, removed and filtered by pet."""
+    owner = Owner(name="Jordan")
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    owner.add_pet(pet)
+    
+    brushing = Task(title="Brushing", duration_minutes=10, priority="low", task_type="grooming")
+    walk = Task(title="Walk", duration_minutes=30, priority="high", task_type="walk", frequency="daily")
+    pet.tasks.append(brushing)
+    pet.tasks.append(walk)
+    
+    assert pet.mark_task_complete("Walk") == True
+    assert walk.completed == True
+    assert pet.bulk_mark_complete(["Walk"]) == 1  # The recurring instance
+    
+    scheduler = Scheduler(owner=owner)
+    assert scheduler.filter_tasks(owner.get_all_tasks(), pet_name="mochi") == pet.get_tasks()
+    
+    assert pet.remove_task("Brushing") == True
+    assert brushing not in pet.get_tasks()
+    assert pet.remove_task("Brushing") == False
+
+
+def test_title_lookups_follow_the_task_list():
+    """Verify completing and removing by title track direct edits to pet.tasks and task titles."""
+    owner = Owner(name="Jordan")
+    pet = Pet(name="Mochi", species="dog", owner=owner)
+    owner.add_pet(pet)
+    
+    # A renamed task is found under its new title
+    walk = Task(title="Walk", duration_minutes=30, priority="high", task_type="walk", frequency="daily")
+    pet.add_task(walk)
+    walk.title = "Run"
+    assert pet.mark_task_complete("Walk") == False
+    assert pet.mark_task_complete("Run") == True
+    
+    # Tasks dropped from the list are no longer completed or removed
+    pet.tasks.clear()
+    pet.add_task(Task(title="Feeding", duration_minutes=10, priority="high", task_type="feeding"))
+    pet.tasks.clear()
+    assert pet.mark_task_complete("Feeding") == False
+    assert pet.remove_task("Feeding") == False
+    assert pet.get_tasks() == []
+    
+    # remove_task drops the first match in list order
+    first = Task(title="Brushing", duration_minutes=10, priority="low", task_type="grooming")
+    second = Task(title="Brushing", duration_minutes=15, priority="low", task_type="grooming")
+    pet.tasks.append(first)
+    pet.add_task(second)
+    assert pet.remove_task("Brushing") == True
+    assert pet.get_tasks()[0] is second
+
+
+def test_conflict_detection_groups_tasks_sharing_a_start_time():
+    """Verify tasks sharing a start time produce one grouped warning, even when they take no time."""
+    owner = Owner(name="Jordan")
+    scheduler = Scheduler(owner=owner)
+    
+    # Three tasks at 10:00 for two pets, two zero-length tasks at 14:00
+    schedule = [
+        {"task": "Walk", "pet": "Mochi", "type": "walk", "duration": 30,
+         "priority": "high", "scheduled_time": "10:00", "scheduled_hour": 10},
+        {"task": "Feeding", "pet": "Whiskers", "type": "feeding", "duration": 15,
+         "priority": "high", "scheduled_time": "10:00", "scheduled_hour": 10},
+        {"task": "Meds", "pet": "Mochi", "type": "meds", "duration": 5,
+         "priority": "high", "scheduled_time": "10:00", "scheduled_hour": 10},
+        {"task": "Check water", "pet": "Mochi", "type": "feeding", "duration": 0,
+         "priority": "low", "scheduled_time": "14:00", "scheduled_hour": 14},
+        {"task": "Check litter", "pet": "Whiskers", "type": "grooming", "duration": 0,
+         "priority": "low", "scheduled_time": "14:00", "scheduled_hour": 14},
+    ]
+    
+    conflicts = scheduler.detect_conflicts(schedule)
+    
+    assert conflicts == [
+        "⚠️ Conflict at 10:00: Multiple tasks scheduled - Walk, Feeding, Meds for pets Mochi, Whiskers",
+        "⚠️ Conflict at 14:00: Multiple tasks scheduled - Check water, Check litter for pets Mochi, Whiskers",
+    ]
+
+
+def test_str_subclass_values_are_accepted():
+    """Verify str subclasses (e.g. numpy.str_ from a dataframe) can be used for vocabulary fields."""
+    class Label(str):
+        pass
+    
+    owner = Owner(name="Jordan")
+    pet = Pet(name="Mochi", species=Label("dog"), owner=owner)
+    task = Task(title="Walk", duration_minutes=30, priority=Label("high"), task_type=Label("walk"))
+    
+    assert pet.species == "dog"
+    assert task.priority == "high"
+    assert task.get_priority_value() == 3